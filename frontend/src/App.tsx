@@ -24,6 +24,7 @@ const App: FC = () => {
 	const [error, setError] = useState("");
 	const [documentContent, setDocumentContent] = useState("");
 	const [documents, setDocuments] = useState<DocumentInfo[]>([]);
+	const [documentsTotal, setDocumentsTotal] = useState(0);
 	const [selectedDocument, setSelectedDocument] =
 		useState<DocumentDetailResponse | null>(null);
 	const [showDocumentDetail, setShowDocumentDetail] = useState(false);
@@ -119,6 +120,23 @@ const App: FC = () => {
 		try {
 			const response = await listDocuments();
 			setDocuments(response.documents);
+			setDocumentsTotal(response.total_count);
+		} catch (err) {
+			setError(err instanceof Error ? err.message : "エラーが発生しました");
+		} finally {
+			setLoading(false);
+		}
+	};
+
+	// ドキュメント一覧の続きを取得するハンドラー
+	const handleLoadMoreDocuments = async () => {
+		setLoading(true);
+		setError("");
+
+		try {
+			const response = await listDocuments(documents.length);
+			setDocuments((prev) => [...prev, ...response.documents]);
+			setDocumentsTotal(response.total_count);
 		} catch (err) {
 			setError(err instanceof Error ? err.message : "エラーが発生しました");
 		} finally {
@@ -153,6 +171,7 @@ const App: FC = () => {
 			const response = await clearDocuments();
 			alert(response.message);
 			setDocuments([]);
+			setDocumentsTotal(0);
 			setSelectedDocument(null);
 			setShowDocumentDetail(false);
 		} catch (err) {
@@ -369,7 +388,7 @@ const App: FC = () => {
 									{/* 一覧パネル */}
 									<div className="bg-white rounded-lg shadow p-6">
 										<h3 className="text-xl font-semibold text-gray-900 mb-4">
-											ドキュメント一覧 ({documents.length})
+											ドキュメント一覧 ({documentsTotal})
 										</h3>
 										{documents.length === 0 ? (
 											<p className="text-center text-gray-500 py-8">
@@ -404,6 +423,16 @@ const App: FC = () => {
 												))}
 											</ul>
 										)}
+										{documents.length < documentsTotal && (
+											<button
+												type="button"
+												onClick={handleLoadMoreDocuments}
+												disabled={loading}
+												className="w-full mt-4 px-4 py-2 bg-gray-100 text-gray-700 rounded-lg hover:bg-gray-200 disabled:bg-gray-300 transition-colors text-sm"
+											>
+												さらに読み込む ({documents.length} / {documentsTotal})
+											</button>
+										)}
 									</div>
 								</div>
 
@@ -141,13 +141,24 @@ export async function uploadDocument(
 	});
 }
 
+/**
+ * ドキュメント一覧の1ページあたりの取得件数（バックエンドの上限は1000件）
+ */
+const DOCUMENT_PAGE_SIZE = 100;
+
 /**
  * ドキュメント一覧取得エンドポイント
+ * 一覧はページングされるため、offset から DOCUMENT_PAGE_SIZE 件ずつ取得します
  */
-export async function listDocuments(): Promise<DocumentListResponse> {
-	return apiRequest<DocumentListResponse>("/documents", {
-		method: "GET",
-	});
+export async function listDocuments(
+	offset = 0,
+): Promise<DocumentListResponse> {
+	return apiRequest<DocumentListResponse>(
+		`/documents?limit=${DOCUMENT_PAGE_SIZE}&offset=${offset}`,
+		{
+			method: "GET",
+		},
+	);
 }
 
 /**
@@ -1,35 +1,39 @@
-import sys
-from pathlib import Path
+from functools import cache, partial
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
-# srcディレクトリをPythonパスに追加
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from infrastructure.container import create_injector
-from presentation.router import get_router
+import config
+from src.domain.interfaces import IRagService, IDocumentService
+from src.infrastructure.auth_middleware import AuthASGIMiddleware
+from src.infrastructure.auth_service import AuthService
+from src.infrastructure.container import create_injector
+from src.infrastructure.cors_middleware import ASGICORSMiddleware
+from src.infrastructure.upload_limit_middleware import UploadSizeLimitASGIMiddleware
+from src.presentation.router import get_router
 
 
 def create_app() -> FastAPI:
     """
     FastAPIアプリケーションを作成します
 
+    RAGサービス・ドキュメントサービスはlangchain_openai・langchain_chromaを
+    読み込むため、インポート時には解決せず、ルーターのlifespanまたは
+    初回利用時に一度だけ解決します。
+
     Returns:
         FastAPIアプリケーションインスタンス
     """
-    from domain.interfaces import IRagService, IDocumentService
-    from infrastructure.auth_service import AuthService
-
     # DIコンテナの作成
     injector = create_injector()
 
-    # サービスの取得
-    rag_service = injector.get(IRagService)
-    document_service = injector.get(IDocumentService)
+    # 認証サービスはミドルウェアの登録に必要なため先に取得する
     auth_service = injector.get(AuthService)
 
+    # サービスの取得関数（解決したインスタンスを保持して2回目以降はそのまま返す）
+    get_rag_service = cache(partial(injector.get, IRagService))
+    get_document_service = cache(partial(injector.get, IDocumentService))
+
     # FastAPIアプリケーションの作成
     app = FastAPI(
         title="LangChain RAG API",
@@ -37,17 +41,25 @@ def create_app() -> FastAPI:
         version="0.1.0",
     )
 
+    # 認証設定（CORSの内側で実行されるよう先に登録する）
+    app.add_middleware(AuthASGIMiddleware, auth_service=auth_service)
+
+    # アップロードサイズ制限（上限を超えるリクエストはボディを受信する前に拒否する）
+    app.add_middleware(
+        UploadSizeLimitASGIMiddleware, max_body_bytes=config.MAX_UPLOAD_BYTES
+    )
+
     # CORS設定
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["http://localhost:5173", "http://localhost:3000", "http://127.0.0.1:5173", "http://127.0.0.1:3000"],
+        ASGICORSMiddleware,
+        allow_origins=config.ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
     # ルーターをアプリケーションに登録
-    router = get_router(rag_service, document_service, auth_service)
+    router = get_router(get_rag_service, get_document_service, auth_service)
     app.include_router(router, prefix="/api/v1")
 
     @app.get("/health")
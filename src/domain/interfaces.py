@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from domain.models import (
+from src.domain.models import (
     AiAnswer,
     UserQuery,
     DocumentInput,
@@ -16,6 +16,29 @@ class IRagService(ABC):
     def generate_answer(self, query: UserQuery) -> AiAnswer:
         pass
 
+    @abstractmethod
+    def generate_answers_batch(self, queries: list[UserQuery]) -> list[AiAnswer]:
+        """
+        複数のクエリに対してまとめて回答を生成します
+
+        Args:
+            queries: ユーザーのクエリのリスト
+
+        Returns:
+            各クエリに対応するAI生成の回答のリスト（入力と同じ順序）
+        """
+        pass
+
+    @abstractmethod
+    def clear_cache(self) -> None:
+        """
+        回答キャッシュをクリアします
+
+        ベクトルストアの内容が変わり、キャッシュ済みの回答が
+        古くなった場合に呼び出します
+        """
+        pass
+
 
 class IDocumentService(ABC):
     """ドキュメント投入・管理用のサービスインターフェース"""
@@ -44,12 +67,18 @@ class IDocumentService(ABC):
         pass
 
     @abstractmethod
-    def list_documents(self) -> DocumentListResult:
+    def list_documents(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> DocumentListResult:
         """
-        ベクトルストア内の全ドキュメント一覧を取得します
+        ベクトルストア内のドキュメント一覧を取得します
+
+        Args:
+            limit: 取得する最大件数（Noneの場合は全件）
+            offset: 取得を開始する位置
 
         Returns:
-            ドキュメント一覧結果
+            ドキュメント一覧結果（total_countはページングに関係なく全件数）
         """
         pass
 
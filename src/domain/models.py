@@ -1,25 +1,27 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class UserQuery:
     content: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AiAnswer:
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentInput:
     """ドキュメント投入用のモデル"""
     content: str
     metadata: Optional[dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentUploadResult:
     """ドキュメント投入結果のモデル"""
     success: bool
@@ -27,7 +29,7 @@ class DocumentUploadResult:
     documents_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentInfo:
     """ドキュメント情報のモデル"""
     id: str
@@ -36,7 +38,7 @@ class DocumentInfo:
     created_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentListResult:
     """ドキュメント一覧結果のモデル"""
     success: bool
@@ -2,11 +2,13 @@
 ユーザー関連のドメインモデル
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """ユーザーモデル"""
     id: str
@@ -15,14 +17,14 @@ class User:
     created_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserLoginRequest:
     """ログインリクエスト"""
     username: str
     password: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserLoginResponse:
     """ログインレスポンス"""
     success: bool
@@ -32,14 +34,14 @@ class UserLoginResponse:
     username: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRegisterRequest:
     """ユーザー登録リクエスト"""
     username: str
     password: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRegisterResponse:
     """ユーザー登録レスポンス"""
     success: bool
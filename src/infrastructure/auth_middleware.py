@@ -2,61 +2,107 @@
 認証ミドルウェア
 """
 
-from fastapi import Header, HTTPException, status
-from typing import Optional
+import json
 
-from infrastructure.auth_service import AuthService
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from src.infrastructure.auth_service import AuthService
 
-def get_auth_service() -> AuthService:
-    """認証サービスを取得します（シングルトン）"""
-    if not hasattr(get_auth_service, "_instance"):
-        get_auth_service._instance = AuthService()
-    return get_auth_service._instance
+# 認証不要のパス
+DEFAULT_EXEMPT_PATHS = frozenset(
+    {
+        "/health",
+        "/api/v1/auth/login",
+        "/api/v1/auth/register",
+        "/api/v1/chat",
+        "/docs",
+        "/docs/oauth2-redirect",
+        "/redoc",
+        "/openapi.json",
+    }
+)
 
 
-async def get_current_user(
-    authorization: Optional[str] = Header(None),
-) -> dict:
-    """
-    認証トークンから現在のユーザーを取得します
+def _encode_error(detail: str) -> bytes:
+    """エラーレスポンスのボディをエンコードします"""
+    return json.dumps({"detail": detail}, ensure_ascii=False).encode()
+
 
-    Args:
-        authorization: Authorizationヘッダー（"Bearer <token>"形式）
+# 401レスポンスのボディは起動時に一度だけエンコードする
+_MISSING_TOKEN_BODY = _encode_error("認証トークンが必要です")
+_INVALID_SCHEME_BODY = _encode_error("無効な認証形式です")
+_INVALID_TOKEN_BODY = _encode_error("無効なトークンです")
 
-    Returns:
-        user_id: ユーザーID
 
-    Raises:
-        HTTPException: トークンが無効または存在しない場合
+class AuthASGIMiddleware:
     """
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="認証トークンが必要です",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    ピュアASGIの認証ミドルウェア
 
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise ValueError("Invalid authentication scheme")
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="無効な認証形式です",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    Authorizationヘッダーのトークンを検証し、user_idを
+    scope["state"]に格納します。Starletteの
+    Request/Responseオブジェクトは生成しません。
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        auth_service: AuthService,
+        exempt_paths: frozenset[str] = DEFAULT_EXEMPT_PATHS,
+    ) -> None:
+        """
+        ミドルウェアを初期化します
+
+        Args:
+            app: ラップするASGIアプリケーション
+            auth_service: トークン検証に使用する認証サービス
+            exempt_paths: 認証不要のパス
+        """
+        self.app = app
+        self.auth_service = auth_service
+        self.exempt_paths = exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+
+        if not authorization:
+            await self._send_unauthorized(send, _MISSING_TOKEN_BODY)
+            return
+
+        parts = authorization.split()
+        if len(parts) != 2 or parts[0].lower() != b"bearer":
+            await self._send_unauthorized(send, _INVALID_SCHEME_BODY)
+            return
+
+        # トークンを検証
+        user_id = self.auth_service.verify_token(parts[1].decode("latin-1"))
+        if not user_id:
+            await self._send_unauthorized(send, _INVALID_TOKEN_BODY)
+            return
 
-    # トークンを検証
-    auth_service = get_auth_service()
-    user_id = auth_service.verify_token(token)
+        scope.setdefault("state", {})["user_id"] = user_id
+        await self.app(scope, receive, send)
 
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="無効なトークンです",
-            headers={"WWW-Authenticate": "Bearer"},
+    @staticmethod
+    async def _send_unauthorized(send: Send, body: bytes) -> None:
+        """401レスポンスを送信します"""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 401,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"www-authenticate", b"Bearer"),
+                ],
+            }
         )
+        await send({"type": "http.response.body", "body": body})
 
-    return {"user_id": user_id}
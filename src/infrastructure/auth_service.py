@@ -4,14 +4,18 @@
 ユーザーの登録、ログイン、トークン生成・検証を管理します。
 """
 
+import base64
 import hashlib
 import hmac
-import json
+import logging
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
-from domain.user_models import (
+import orjson
+
+from src.domain.user_models import (
     User,
     UserLoginRequest,
     UserLoginResponse,
@@ -20,16 +24,30 @@ from domain.user_models import (
 )
 import config
 
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
     """認証サービス"""
 
+    # 検証済みトークンキャッシュの最大件数
+    TOKEN_CACHE_SIZE = 4096
+
     def __init__(self):
         """サービスを初期化します"""
         # メモリ内ユーザーストア（本番環境ではDBを使用）
         self._users: dict[str, User] = {}
+        # ユーザー名からユーザーIDへのインデックス
+        self._username_index: dict[str, str] = {}
         # トークンストア（本番環境ではRedis等を使用）
         self._tokens: dict[str, dict] = {}
+        # 検証済みトークンのキャッシュ（token -> (有効期限, user_id)）
+        self._token_cache: dict[str, tuple[float, str]] = {}
+        # トークンごとに変わらない署名鍵とヘッダーは初期化時に一度だけエンコード
+        self._signing_key = (config.OPENAI_API_KEY or "secret").encode()
+        self._header_encoded = base64.urlsafe_b64encode(
+            orjson.dumps({"typ": "JWT", "alg": "HS256"})
+        ).rstrip(b"=")
         # テストユーザーを作成
         self._create_test_user()
 
@@ -42,6 +60,7 @@ class AuthService:
             created_at=datetime.now().isoformat(),
         )
         self._users[test_user.id] = test_user
+        self._username_index[test_user.username] = test_user.id
 
     def _hash_password(self, password: str) -> str:
         """パスワードをハッシュ化します"""
@@ -50,76 +69,89 @@ class AuthService:
     def _generate_token(self, user_id: str) -> str:
         """JWTライクなトークンを生成します"""
         # 簡易的なトークン実装
-        header = {"typ": "JWT", "alg": "HS256"}
+        now = datetime.now()
         payload = {
             "user_id": user_id,
-            "exp": (
-                datetime.now() + timedelta(hours=24)
-            ).timestamp(),  # 24時間有効
-            "iat": datetime.now().timestamp(),
+            "exp": (now + timedelta(hours=24)).timestamp(),  # 24時間有効
+            "iat": now.timestamp(),
         }
 
         # シンプルなBase64エンコーディング（本番環境ではPyJWTを使用）
-        import base64
+        payload_encoded = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
 
-        header_encoded = base64.urlsafe_b64encode(
-            json.dumps(header).encode()
-        ).rstrip(b"=")
-        payload_encoded = base64.urlsafe_b64encode(
-            json.dumps(payload).encode()
-        ).rstrip(b"=")
-
-        message = header_encoded + b"." + payload_encoded
-        signature = hmac.new(
-            config.OPENAI_API_KEY.encode() if config.OPENAI_API_KEY else b"secret",
-            message,
-            hashlib.sha256,
-        ).digest()
-        signature_encoded = base64.urlsafe_b64encode(signature).rstrip(b"=")
-
-        token = message + b"." + signature_encoded
+        message = self._header_encoded + b"." + payload_encoded
+        token = message + b"." + self._sign(message)
         return token.decode()
 
+    def _sign(self, message: bytes) -> bytes:
+        """メッセージのBase64エンコード済みHMAC署名を返します"""
+        signature = hmac.new(self._signing_key, message, hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(signature).rstrip(b"=")
+
     def _verify_token(self, token: str) -> Optional[str]:
         """トークンを検証してuser_idを返します"""
-        try:
-            import base64
+        now = time.time()
+
+        # 検証済みのトークンはキャッシュから返す
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            exp, user_id = cached
+            if exp < now:
+                del self._token_cache[token]
+                return None
+            return user_id
 
+        try:
             parts = token.split(".")
             if len(parts) != 3:
                 return None
 
             header_encoded, payload_encoded, signature_encoded = parts
 
+            # 署名を検証
+            message = f"{header_encoded}.{payload_encoded}".encode("ascii")
+            if not hmac.compare_digest(
+                self._sign(message), signature_encoded.encode("ascii")
+            ):
+                return None
+
             # パディングを追加
             def add_padding(s: str) -> str:
                 return s + "=" * (4 - len(s) % 4)
 
             payload_json = base64.urlsafe_b64decode(add_padding(payload_encoded))
-            payload = json.loads(payload_json)
+            payload = orjson.loads(payload_json)
 
             # 有効期限を確認
-            if payload.get("exp", 0) < datetime.now().timestamp():
+            exp = payload.get("exp", 0)
+            if exp < now:
                 return None
 
-            return payload.get("user_id")
+            user_id = payload.get("user_id")
+            if user_id:
+                # 上限を超える場合は最も古いエントリを削除
+                if len(self._token_cache) >= self.TOKEN_CACHE_SIZE:
+                    del self._token_cache[next(iter(self._token_cache))]
+                self._token_cache[token] = (exp, user_id)
+
+            return user_id
 
         except Exception as e:
-            print(f"Token verification error: {e}")
+            # 不正なトークンはクライアント起因のため、スタックトレースは出力しない
+            logger.warning("Token verification error: %s", e)
             return None
 
     def register(self, request: UserRegisterRequest) -> UserRegisterResponse:
         """ユーザーを登録します"""
         # ユーザー名が既に使用されているか確認
-        for user in self._users.values():
-            if user.username == request.username:
-                return UserRegisterResponse(
-                    success=False,
-                    message="このユーザー名は既に使用されています",
-                )
+        if request.username in self._username_index:
+            return UserRegisterResponse(
+                success=False,
+                message="このユーザー名は既に使用されています",
+            )
 
         # 新しいユーザーを作成
-        user_id = str(uuid.uuid4())
+        user_id = uuid.uuid4().hex
         user = User(
             id=user_id,
             username=request.username,
@@ -128,6 +160,7 @@ class AuthService:
         )
 
         self._users[user_id] = user
+        self._username_index[request.username] = user_id
 
         return UserRegisterResponse(
             success=True,
@@ -138,11 +171,8 @@ class AuthService:
     def login(self, request: UserLoginRequest) -> UserLoginResponse:
         """ユーザーをログインさせます"""
         # ユーザー名でユーザーを検索
-        user = None
-        for u in self._users.values():
-            if u.username == request.username:
-                user = u
-                break
+        user_id = self._username_index.get(request.username)
+        user = self._users.get(user_id) if user_id else None
 
         if not user:
             return UserLoginResponse(
@@ -150,8 +180,9 @@ class AuthService:
                 message="ユーザー名またはパスワードが間違っています",
             )
 
-        # パスワードを検証
-        if user.password_hash != self._hash_password(request.password):
+        # パスワードを検証（タイミング攻撃対策として定数時間で比較）
+        candidate = self._hash_password(request.password)
+        if not hmac.compare_digest(user.password_hash, candidate):
             return UserLoginResponse(
                 success=False,
                 message="ユーザー名またはパスワードが間違っています",
@@ -3,17 +3,20 @@
 
 このモジュールは、injectorライブラリを使用して、
 アプリケーション全体の依存性を管理します。
+
+langchain_openai・langchain_chromaは読み込みが重いため、
+各プロバイダー内で遅延インポートします。injectorはプロバイダーの
+型注釈を実行時に解決するので、バインディングのキーには
+langchain_coreの抽象クラスを使用します。
 """
 
 from injector import Injector, Module, provider, singleton
-from pydantic import SecretStr
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_chroma import Chroma
-
-from domain.interfaces import IRagService, IDocumentService
-from infrastructure.rag_service import LangChainRagService
-from infrastructure.document_service import LangChainDocumentService
-from infrastructure.auth_service import AuthService
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel
+from langchain_core.vectorstores import VectorStore
+
+from src.domain.interfaces import IRagService, IDocumentService
+from src.infrastructure.auth_service import AuthService
 import config
 
 
@@ -22,35 +25,39 @@ class AppModule(Module):
 
     @singleton
     @provider
-    def provide_llm(self) -> ChatOpenAI:
+    def provide_llm(self) -> BaseChatModel:
         """
         ChatOpenAIのプロバイダー
 
         Returns:
             シングルトンのChatOpenAIインスタンス
         """
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
-            api_key=SecretStr(config.OPENAI_API_KEY) if config.OPENAI_API_KEY else None,
+            api_key=config.OPENAI_API_KEY_SECRET,
             model=config.OPENAI_MODEL,
             temperature=0.7,
         )
 
     @singleton
     @provider
-    def provide_embeddings(self) -> OpenAIEmbeddings:
+    def provide_embeddings(self) -> Embeddings:
         """
         OpenAIEmbeddingsのプロバイダー
 
         Returns:
             シングルトンのOpenAIEmbeddingsインスタンス
         """
+        from langchain_openai import OpenAIEmbeddings
+
         return OpenAIEmbeddings(
-            api_key=SecretStr(config.OPENAI_API_KEY) if config.OPENAI_API_KEY else None,
+            api_key=config.OPENAI_API_KEY_SECRET,
         )
 
     @singleton
     @provider
-    def provide_vector_store(self, embeddings: OpenAIEmbeddings) -> Chroma:
+    def provide_vector_store(self, embeddings: Embeddings) -> VectorStore:
         """
         Chromaベクトルストアのプロバイダー
 
@@ -60,6 +67,8 @@ class AppModule(Module):
         Returns:
             シングルトンのChromaインスタンス
         """
+        from langchain_chroma import Chroma
+
         return Chroma(
             persist_directory=config.CHROMA_PERSIST_DIRECTORY,
             embedding_function=embeddings,
@@ -69,7 +78,7 @@ class AppModule(Module):
     @singleton
     @provider
     def provide_rag_service(
-        self, llm: ChatOpenAI, embeddings: OpenAIEmbeddings, vector_store: Chroma
+        self, llm: BaseChatModel, embeddings: Embeddings, vector_store: VectorStore
     ) -> IRagService:
         """
         RAGサービスのプロバイダー
@@ -82,12 +91,14 @@ class AppModule(Module):
         Returns:
             シングルトンのIRagService実装インスタンス
         """
+        from src.infrastructure.rag_service import LangChainRagService
+
         return LangChainRagService(llm=llm, embeddings=embeddings, vector_store=vector_store)
 
     @singleton
     @provider
     def provide_document_service(
-        self, embeddings: OpenAIEmbeddings, vector_store: Chroma
+        self, embeddings: Embeddings, vector_store: VectorStore
     ) -> IDocumentService:
         """
         ドキュメントサービスのプロバイダー
@@ -99,6 +110,8 @@ class AppModule(Module):
         Returns:
             シングルトンのIDocumentService実装インスタンス
         """
+        from src.infrastructure.document_service import LangChainDocumentService
+
         return LangChainDocumentService(embeddings=embeddings, vector_store=vector_store)
 
     @singleton
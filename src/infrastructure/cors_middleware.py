@@ -0,0 +1,123 @@
+"""
+CORSミドルウェア
+
+StarletteのCORSMiddlewareを置き換えるピュアASGI実装です。
+レスポンスヘッダーの値は初期化時に一度だけエンコードします。
+"""
+
+from collections.abc import Collection, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+
+class ASGICORSMiddleware:
+    """ピュアASGIのCORSミドルウェア"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Collection[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+    ) -> None:
+        """
+        ミドルウェアを初期化します
+
+        Args:
+            app: ラップするASGIアプリケーション
+            allow_origins: 許可するオリジンの集合
+            allow_methods: 許可するHTTPメソッドのリスト（"*"で全メソッド）
+            allow_headers: 許可するリクエストヘッダーのリスト（"*"で全ヘッダー）
+            allow_credentials: 資格情報付きリクエストを許可するかどうか
+        """
+        if "*" in allow_methods:
+            allow_methods = ALL_METHODS
+
+        self.app = app
+        self._allow_all_headers = "*" in allow_headers
+        # オリジンはヘッダーの生バイト列と直接照合できるようバイト列で保持する
+        self._allow_origins = frozenset(o.encode() for o in allow_origins)
+
+        # レスポンスヘッダーはリクエストごとに組み立てず、ここで一度だけ生成する
+        self._allow_methods_hdr = (
+            b"access-control-allow-methods",
+            b", ".join(m.encode() for m in allow_methods),
+        )
+        self._allow_headers_hdr = (
+            b"access-control-allow-headers",
+            b", ".join(h.lower().encode() for h in allow_headers if h != "*"),
+        )
+        self._simple_headers: tuple[tuple[bytes, bytes], ...] = ((b"vary", b"Origin"),)
+        if allow_credentials:
+            self._simple_headers += (
+                (b"access-control-allow-credentials", b"true"),
+            )
+        self._preflight_headers = (
+            self._allow_methods_hdr,
+            (b"access-control-max-age", b"600"),
+            *self._simple_headers,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or origin not in self._allow_origins:
+            await self.app(scope, receive, send)
+            return
+
+        # プリフライトリクエストは後続のアプリに渡さずに応答する
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._send_preflight_response(send, origin, request_headers)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", ()),
+                        (b"access-control-allow-origin", origin),
+                        *self._simple_headers,
+                    ],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_preflight_response(
+        self, send: Send, origin: bytes, request_headers: bytes | None
+    ) -> None:
+        """プリフライトリクエストに本文なしの204で応答します"""
+        if self._allow_all_headers and request_headers is not None:
+            allow_headers_hdr = (b"access-control-allow-headers", request_headers)
+        else:
+            allow_headers_hdr = self._allow_headers_hdr
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [
+                    (b"access-control-allow-origin", origin),
+                    allow_headers_hdr,
+                    *self._preflight_headers,
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
@@ -5,17 +5,18 @@
 ドキュメントを投入・管理するサービスを提供します。
 """
 
+import threading
 import uuid
 from typing import Optional
 from datetime import datetime
 
 from langchain_chroma import Chroma
-from langchain_openai import OpenAIEmbeddings
-from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
-from domain.interfaces import IDocumentService
-from domain.models import (
+from src.domain.interfaces import IDocumentService
+from src.domain.models import (
     DocumentInput,
     DocumentUploadResult,
     DocumentInfo,
@@ -23,6 +24,11 @@ from domain.models import (
 )
 import config
 
+# DocumentInfo.metadataに含めない内部用のメタデータキー
+_EXCLUDED_META_KEYS = frozenset(
+    {"document_id", "created_at", "full_content", "chunk_index"}
+)
+
 
 class LangChainDocumentService(IDocumentService):
     """
@@ -31,19 +37,31 @@ class LangChainDocumentService(IDocumentService):
 
     def __init__(
         self,
-        embeddings: OpenAIEmbeddings,
-        vector_store: Chroma,
+        embeddings: Embeddings,
+        vector_store: VectorStore,
     ) -> None:
         """
         ドキュメントサービスを初期化します
 
         Args:
-            embeddings: OpenAIEmbeddingsのインスタンス
-            vector_store: Chromaベクトルストアのインスタンス
+            embeddings: 埋め込みモデルのインスタンス（OpenAIEmbeddings）
+            vector_store: ベクトルストアのインスタンス（Chroma）
+
+        Raises:
+            TypeError: ベクトルストアがChromaでない場合
         """
+        # 一覧取得・全削除にはChroma固有のAPI（get / reset_collection）を使用する
+        if not isinstance(vector_store, Chroma):
+            raise TypeError(
+                f"LangChainDocumentService requires a Chroma vector store, got {type(vector_store).__name__}"
+            )
         self.embeddings = embeddings
         self.vector_store = vector_store
 
+        # chunk_indexを持たない既存チャンクの補完はプロセスごとに一度だけ行う
+        self._chunk_index_ready = False
+        self._chunk_index_lock = threading.Lock()
+
         # テキストスプリッター（ドキュメント分割用）
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=config.CHUNK_SIZE,
@@ -62,38 +80,42 @@ class LangChainDocumentService(IDocumentService):
             投入結果
         """
         try:
-            # DocumentInputをLangChainのDocumentオブジェクトに変換
-            langchain_docs: list[Document] = []
-            total_chunks = 0
+            # 同じリクエストで投入するドキュメントは作成日時を共有する
+            created_at = datetime.now().isoformat()
+
+            # チャンクのテキスト・メタデータ・IDをそれぞれリストにまとめる
+            texts: list[str] = []
+            metadatas: list[dict] = []
+            ids: list[str] = []
 
             for doc_input in documents:
                 # ドキュメントIDを生成
-                doc_id = str(uuid.uuid4())
-                created_at = datetime.now().isoformat()
+                doc_id = uuid.uuid4().hex
 
                 # テキストを分割
                 chunks = self.text_splitter.split_text(doc_input.content)
-                total_chunks += len(chunks)
 
-                # チャンクごとにDocumentオブジェクトを作成
-                for chunk in chunks:
-                    metadata = doc_input.metadata or {}
+                # チャンクごとにテキスト・メタデータ・IDを追加
+                for i, chunk in enumerate(chunks):
+                    # チャンク間でメタデータを共有しないようにコピーする
+                    metadata = dict(doc_input.metadata) if doc_input.metadata else {}
                     # メタデータにドキュメント情報を追加
                     metadata["document_id"] = doc_id
                     metadata["created_at"] = created_at
+                    metadata["chunk_index"] = i
                     # 最初のチャンクのみに完全なドキュメント内容を保存
-                    if chunk == chunks[0]:
+                    if i == 0:
                         metadata["full_content"] = doc_input.content
 
-                    doc = Document(
-                        page_content=chunk,
-                        metadata=metadata,
-                    )
-                    langchain_docs.append(doc)
+                    texts.append(chunk)
+                    metadatas.append(metadata)
+                    ids.append(f"{doc_id}_{i}")
+
+            # ベクトルストアに追加（埋め込みは全チャンクで一括計算される）
+            if texts:
+                self.vector_store.add_texts(texts=texts, metadatas=metadatas, ids=ids)
 
-            # ベクトルストアに追加
-            if langchain_docs:
-                self.vector_store.add_documents(langchain_docs)
+            total_chunks = len(texts)
 
             return DocumentUploadResult(
                 success=True,
@@ -116,23 +138,10 @@ class LangChainDocumentService(IDocumentService):
             クリア結果
         """
         try:
-            # Chromaのコレクションから全ドキュメントを削除
-            # Chromaベクトルストアを再初期化することでクリアする
-            from langchain_chroma import Chroma as ChromaVectorStore
-
-            # 既存のコレクションを削除
-            ChromaVectorStore(
-                persist_directory=config.CHROMA_PERSIST_DIRECTORY,
-                embedding_function=self.embeddings,
-                collection_name=config.CHROMA_COLLECTION_NAME,
-            ).delete_collection()
-
-            # コレクションを再作成
-            self.vector_store = Chroma(
-                persist_directory=config.CHROMA_PERSIST_DIRECTORY,
-                embedding_function=self.embeddings,
-                collection_name=config.CHROMA_COLLECTION_NAME,
-            )
+            # Chromaのコレクションを削除して再作成する
+            # RAGサービスと共有している同じインスタンス上でリセットするため、
+            # 既存のクライアント（SQLite接続）を再利用でき、参照も古くならない
+            self.vector_store.reset_collection()
 
             return DocumentUploadResult(
                 success=True,
@@ -147,52 +156,55 @@ class LangChainDocumentService(IDocumentService):
                 documents_count=None,
             )
 
-    def list_documents(self) -> DocumentListResult:
+    def list_documents(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> DocumentListResult:
         """
-        ベクトルストア内の全ドキュメント一覧を取得します
+        ベクトルストア内のドキュメント一覧を取得します
+
+        Args:
+            limit: 取得する最大件数（Noneの場合は全件）
+            offset: 取得を開始する位置
 
         Returns:
-            ドキュメント一覧結果
+            ドキュメント一覧結果（total_countはページングに関係なく全件数）
         """
         try:
-            documents: list[DocumentInfo] = []
-            seen_doc_ids: set[str] = set()
-
-            # Chromaから全ドキュメントを取得
-            all_docs = self.vector_store.get(include=["metadatas"])
-
-            if all_docs and all_docs["metadatas"]:
-                for metadata in all_docs["metadatas"]:
-                    doc_id = metadata.get("document_id")
-                    # 同じドキュメントIDは1回だけ処理
-                    if doc_id and doc_id not in seen_doc_ids:
-                        seen_doc_ids.add(doc_id)
-
-                        # 完全なコンテンツを取得
-                        content = metadata.get("full_content", "")
-                        # 完全なコンテンツがない場合は先頭100字で省略
-                        if not content:
-                            content = "Document content not available"
-                        elif len(content) > 100:
-                            content = content[:100] + "..."
-
-                        doc = DocumentInfo(
-                            id=doc_id,
-                            content=content,
-                            metadata={
-                                k: v
-                                for k, v in metadata.items()
-                                if k not in ["document_id", "created_at", "full_content"]
-                            },
-                            created_at=metadata.get("created_at"),
-                        )
-                        documents.append(doc)
+            self._ensure_chunk_index()
+
+            # 件数は先頭チャンクのIDのみで数える（メタデータは読み込まない）
+            total_count = len(
+                self.vector_store.get(where={"chunk_index": 0}, include=[])["ids"]
+            )
+
+            # 指定された範囲の先頭チャンクのみをChromaから取得する
+            # （完全なコンテンツは先頭チャンクのメタデータにのみ保存されている）
+            page = self.vector_store.get(
+                where={"chunk_index": 0},
+                limit=limit,
+                offset=offset,
+                include=["metadatas"],
+            )
+            documents = [
+                DocumentInfo(
+                    id=metadata["document_id"],
+                    content=metadata.get("full_content")
+                    or "Document content not available",
+                    metadata={
+                        k: v
+                        for k, v in metadata.items()
+                        if k not in _EXCLUDED_META_KEYS
+                    },
+                    created_at=metadata.get("created_at"),
+                )
+                for metadata in page["metadatas"]
+            ]
 
             return DocumentListResult(
                 success=True,
                 message=f"Retrieved {len(documents)} document(s)",
                 documents=documents,
-                total_count=len(documents),
+                total_count=total_count,
             )
 
         except Exception as e:
@@ -203,6 +215,56 @@ class LangChainDocumentService(IDocumentService):
                 total_count=0,
             )
 
+    def _ensure_chunk_index(self) -> None:
+        """
+        chunk_indexを持たない既存チャンクにchunk_indexを補完します
+
+        chunk_index導入前に投入されたチャンクは一覧取得の条件に一致しないため、
+        初回の一覧取得時に一度だけ全件を走査してメタデータを更新します。
+        """
+        if self._chunk_index_ready:
+            return
+
+        with self._chunk_index_lock:
+            if self._chunk_index_ready:
+                return
+
+            collection = self.vector_store._collection
+            indexed = self.vector_store.get(
+                where={"chunk_index": {"$gte": -1}}, include=[]
+            )
+            if len(indexed["ids"]) != collection.count():
+                all_docs = self.vector_store.get(include=["metadatas"])
+
+                # ドキュメントIDごとに未補完のチャンクをまとめる
+                chunks_by_doc: dict[Optional[str], list[tuple[str, dict]]] = {}
+                for chunk_id, metadata in zip(all_docs["ids"], all_docs["metadatas"]):
+                    if "chunk_index" in metadata:
+                        continue
+                    chunks_by_doc.setdefault(metadata.get("document_id"), []).append(
+                        (chunk_id, metadata)
+                    )
+
+                chunk_indexes: dict[str, int] = {}
+                for doc_id, chunks in chunks_by_doc.items():
+                    if not doc_id:
+                        # ドキュメントIDのないチャンクは一覧に含めない
+                        chunk_indexes.update((chunk_id, -1) for chunk_id, _ in chunks)
+                        continue
+                    # full_contentを持つチャンクを先頭として扱う
+                    chunks.sort(key=lambda chunk: "full_content" not in chunk[1])
+                    for i, (chunk_id, _) in enumerate(chunks):
+                        chunk_indexes[chunk_id] = i
+
+                # updateは既存のメタデータにキーをマージする
+                if chunk_indexes:
+                    collection.update(
+                        ids=list(chunk_indexes),
+                        metadatas=[{"chunk_index": i} for i in chunk_indexes.values()],
+                    )
+
+            self._chunk_index_ready = True
+
     def get_document(self, document_id: str) -> Optional[DocumentInfo]:
         """
         指定されたIDのドキュメント詳細を取得します
@@ -214,27 +276,30 @@ class LangChainDocumentService(IDocumentService):
             ドキュメント情報、見つからない場合はNone
         """
         try:
-            # Chromaから全ドキュメントを取得
-            all_docs = self.vector_store.get(include=["metadatas"])
-
-            if all_docs and all_docs["metadatas"]:
-                for metadata in all_docs["metadatas"]:
-                    if metadata.get("document_id") == document_id:
-                        # 最初にマッチしたメタデータから完全なコンテンツを取得
-                        content = metadata.get("full_content", "")
-
-                        return DocumentInfo(
-                            id=document_id,
-                            content=content,
-                            metadata={
-                                k: v
-                                for k, v in metadata.items()
-                                if k not in ["document_id", "created_at", "full_content"]
-                            },
-                            created_at=metadata.get("created_at"),
-                        )
+            # 対象ドキュメントのチャンクのみをChromaから取得
+            result = self.vector_store.get(
+                where={"document_id": document_id}, include=["metadatas"]
+            )
+            metadatas = result["metadatas"] if result else None
+            if not metadatas:
+                return None
 
-            return None
+            # 完全なコンテンツは最初のチャンクのメタデータにのみ保存されている
+            metadata = next(
+                (m for m in metadatas if "full_content" in m), metadatas[0]
+            )
+            content = metadata.get("full_content", "")
+
+            return DocumentInfo(
+                id=document_id,
+                content=content,
+                metadata={
+                    k: v
+                    for k, v in metadata.items()
+                    if k not in _EXCLUDED_META_KEYS
+                },
+                created_at=metadata.get("created_at"),
+            )
 
         except Exception:
             return None
@@ -1,34 +1,43 @@
-from typing import Any, List
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_chroma import Chroma
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnablePassthrough
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
 
-from domain.interfaces import IRagService
-from domain.models import UserQuery, AiAnswer
+from src.domain.interfaces import IRagService
+from src.domain.models import UserQuery, AiAnswer
 import config
 
+logger = logging.getLogger(__name__)
+
 
 class LangChainRagService(IRagService):
     """
     LangChainを使用したRAGサービス
     """
 
+    # 回答キャッシュの最大件数
+    ANSWER_CACHE_SIZE = 1024
+
     def __init__(
         self,
-        llm: ChatOpenAI,
-        embeddings: OpenAIEmbeddings,
-        vector_store: Chroma,
+        llm: BaseChatModel,
+        embeddings: Embeddings,
+        vector_store: VectorStore,
     ) -> None:
         """
         RAGサービスを初期化します
 
         Args:
-            llm: ChatOpenAIのインスタンス
-            embeddings: OpenAIEmbeddingsのインスタンス
-            vector_store: Chromaベクトルストアのインスタンス
+            llm: チャットモデルのインスタンス（ChatOpenAI）
+            embeddings: 埋め込みモデルのインスタンス（OpenAIEmbeddings）
+            vector_store: ベクトルストアのインスタンス（Chroma）
         """
         self.llm = llm
         self.embeddings = embeddings
@@ -52,6 +61,19 @@ class LangChainRagService(IRagService):
             input_variables=["context", "question"],
         )
 
+        # 質問文をキーとした回答のLRUキャッシュ
+        self._answer_cache: OrderedDict[str, str] = OrderedDict()
+        self._answer_cache_lock = threading.Lock()
+        # clear_cacheの呼び出し回数（クリア前に開始した回答の保存を防ぐ）
+        self._answer_cache_generation = 0
+
+        # RAGチェーンはリクエストごとに組み立てず、ここで一度だけ構築する
+        self._answer_chain = self.prompt | self.llm | StrOutputParser()
+        self._rag_chain = {
+            "context": self.retriever | self._format_docs,
+            "question": RunnablePassthrough(),
+        } | self._answer_chain
+
     def generate_answer(self, query: UserQuery) -> AiAnswer:
         """
         ユーザーのクエリに対してRAGを使用して回答を生成します
@@ -62,39 +84,99 @@ class LangChainRagService(IRagService):
         Returns:
             AI生成の回答
         """
-        try:
-            # ベクトルストアのドキュメント数を確認
-            stored_data = self.vector_store.get()
-            num_documents = len(stored_data.get("ids", [])) if stored_data else 0
-            print(f"DEBUG: Vector store has {num_documents} documents")
-
-            # ドキュメント検索のテスト
-            retrieved_docs = self.retriever.invoke(query.content)
-            print(f"DEBUG: Retrieved {len(retrieved_docs)} documents for query: {query.content}")
-            for i, doc in enumerate(retrieved_docs):
-                print(f"DEBUG: Doc {i} - {doc.page_content[:100]}...")
-
-            # RAGチェーンの構築
-            rag_chain = (
-                {
-                    "context": self.retriever | self._format_docs,
-                    "question": RunnablePassthrough(),
-                }
-                | self.prompt
-                | self.llm
-                | StrOutputParser()
-            )
-
-            # クエリの実行
-            answer = rag_chain.invoke(query.content)
-
-            return AiAnswer(content=answer)
-
-        except Exception as e:
-            print(f"DEBUG: Error in generate_answer: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return AiAnswer(content=f"エラーが発生しました: {str(e)}")
+        return self.generate_answers_batch([query])[0]
+
+    def generate_answers_batch(self, queries: list[UserQuery]) -> list[AiAnswer]:
+        """
+        複数のクエリに対してまとめて回答を生成します
+
+        キャッシュにない質問だけをRAGチェーンのバッチ実行に渡し、
+        文脈の検索とLLMの呼び出しを並行して行います。
+
+        Args:
+            queries: ユーザーのクエリのリスト
+
+        Returns:
+            各クエリに対応するAI生成の回答のリスト（入力と同じ順序）
+        """
+        keys = [self._cache_key(query.content) for query in queries]
+        cached: list[Optional[str]] = [self._get_cached_answer(key) for key in keys]
+        misses = [i for i, answer in enumerate(cached) if answer is None]
+
+        # キャッシュになかった質問の回答（クエリの位置 -> 回答）
+        generated: dict[int, str] = {}
+        if misses:
+            generation = self._answer_cache_generation
+            questions = [queries[i].content for i in misses]
+            # 1件の失敗が他の質問に影響しないよう、例外は結果として受け取る
+            results = self._rag_chain.batch(questions, return_exceptions=True)
+
+            for i, result in zip(misses, results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to generate answer", exc_info=result)
+                    generated[i] = f"エラーが発生しました: {str(result)}"
+                else:
+                    generated[i] = result
+                    self._store_answer(keys[i], result, generation)
+
+        return [
+            AiAnswer(content=answer if answer is not None else generated[i])
+            for i, answer in enumerate(cached)
+        ]
+
+    def clear_cache(self) -> None:
+        """
+        回答キャッシュをクリアします
+        """
+        with self._answer_cache_lock:
+            self._answer_cache.clear()
+            self._answer_cache_generation += 1
+
+    def _cache_key(self, question: str) -> str:
+        """
+        質問文を正規化してキャッシュキーを生成します
+
+        Args:
+            question: 質問文
+
+        Returns:
+            空白を正規化した質問文
+        """
+        return " ".join(question.split())
+
+    def _get_cached_answer(self, key: str) -> Optional[str]:
+        """
+        キャッシュから回答を取得します
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュ済みの回答、存在しない場合はNone
+        """
+        with self._answer_cache_lock:
+            answer = self._answer_cache.get(key)
+            if answer is not None:
+                self._answer_cache.move_to_end(key)
+            return answer
+
+    def _store_answer(self, key: str, answer: str, generation: int) -> None:
+        """
+        回答をキャッシュに保存します（上限を超えた場合は最も古いものを削除）
+
+        Args:
+            key: キャッシュキー
+            answer: 回答
+            generation: 回答の生成を開始した時点のキャッシュ世代
+        """
+        with self._answer_cache_lock:
+            # 生成中にキャッシュがクリアされた場合は古い文脈の回答なので保存しない
+            if generation != self._answer_cache_generation:
+                return
+            self._answer_cache[key] = answer
+            self._answer_cache.move_to_end(key)
+            if len(self._answer_cache) > self.ANSWER_CACHE_SIZE:
+                self._answer_cache.popitem(last=False)
 
     def _format_docs(self, docs: List[Document]) -> str:
         """
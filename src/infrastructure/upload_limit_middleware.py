@@ -0,0 +1,115 @@
+"""
+アップロードサイズ制限ミドルウェア
+
+Content-Lengthヘッダーでリクエストボディのサイズを確認し、
+上限を超えるリクエストはボディを読み込む前に413で拒否するピュアASGI実装です。
+Content-Lengthのないchunkedリクエストは、受信したボディのバイト数を数えて
+上限を超えた時点で413を返します。
+"""
+
+import json
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# サイズ制限を適用するパス
+DEFAULT_LIMITED_PATHS = frozenset({"/api/v1/documents/upload-file"})
+
+
+def upload_too_large_detail(max_body_bytes: int) -> str:
+    """
+    サイズ上限を超えたときのエラーメッセージを返します
+
+    Args:
+        max_body_bytes: リクエストボディの最大バイト数
+
+    Returns:
+        413レスポンスのdetail
+    """
+    return f"ファイルサイズが上限（{max_body_bytes}バイト）を超えています"
+
+
+# FastAPIのボディ解析中に送出されても400に変換されないようHTTPExceptionを継承する
+class _BodyTooLarge(HTTPException):
+    """受信中のボディが上限を超えたことを示す例外"""
+
+
+class UploadSizeLimitASGIMiddleware:
+    """ピュアASGIのアップロードサイズ制限ミドルウェア"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_bytes: int,
+        limited_paths: frozenset[str] = DEFAULT_LIMITED_PATHS,
+    ) -> None:
+        """
+        ミドルウェアを初期化します
+
+        Args:
+            app: ラップするASGIアプリケーション
+            max_body_bytes: リクエストボディの最大バイト数
+            limited_paths: サイズ制限を適用するパス
+        """
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.limited_paths = limited_paths
+        # 413レスポンスのボディは起動時に一度だけエンコードする
+        self._too_large_detail = upload_too_large_detail(max_body_bytes)
+        self._too_large_body = json.dumps(
+            {"detail": self._too_large_detail}, ensure_ascii=False
+        ).encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.limited_paths:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_bytes:
+                    await self._send_too_large(send)
+                    return
+                break
+
+        # Content-Lengthがない、または実際のボディと異なる場合に備えて
+        # 受信したボディのバイト数を数え、上限を超えたら読み込みを打ち切る
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    raise _BodyTooLarge(status_code=413, detail=self._too_large_detail)
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except _BodyTooLarge:
+            # アプリ側で413に変換されなかった場合のみここで返す
+            if not response_started:
+                await self._send_too_large(send)
+
+    async def _send_too_large(self, send: Send) -> None:
+        """413レスポンスを送信します"""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 413,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(self._too_large_body)).encode()),
+                    (b"connection", b"close"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": self._too_large_body})
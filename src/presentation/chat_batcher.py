@@ -0,0 +1,128 @@
+"""
+チャットリクエストのマイクロバッチ処理
+
+短い時間窓の間に届いたチャットリクエストをまとめ、
+RAGサービスのバッチAPIに一度に渡します。
+"""
+
+import asyncio
+from collections.abc import Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.domain.interfaces import IRagService
+from src.domain.models import AiAnswer, UserQuery
+
+# キューに積む（クエリ, 回答を受け取るFuture）の組
+_Pending = tuple[UserQuery, asyncio.Future[AiAnswer]]
+
+
+class ChatBatcher:
+    """同時に届いたチャットリクエストをまとめて処理するバッチャー"""
+
+    def __init__(
+        self,
+        get_rag_service: Callable[[], IRagService],
+        max_batch_size: int = 16,
+        window_seconds: float = 0.01,
+    ) -> None:
+        """
+        バッチャーを初期化します
+
+        Args:
+            get_rag_service: 回答生成に使用するRAGサービスを返す関数
+            max_batch_size: 1バッチに含める最大リクエスト数
+            window_seconds: 最初のリクエストから後続を待つ時間（秒）
+        """
+        self._get_rag_service = get_rag_service
+        self._max_batch_size = max_batch_size
+        self._window_seconds = window_seconds
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    async def submit(self, query: UserQuery) -> AiAnswer:
+        """
+        クエリをバッチに追加し、回答を待ちます
+
+        Args:
+            query: ユーザーのクエリ
+
+        Returns:
+            AI生成の回答
+        """
+        # ワーカーは実行中のイベントループ上で初回リクエスト時に起動する
+        queue = self._queue
+        if queue is None or self._worker is None or self._worker.done():
+            queue = asyncio.Queue()
+            self._queue = queue
+            self._worker = asyncio.create_task(self._run(queue))
+
+        future: asyncio.Future[AiAnswer] = asyncio.get_running_loop().create_future()
+        queue.put_nowait((query, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """
+        ワーカーを停止し、回答待ちのリクエストをすべて失敗させます
+        """
+        worker, queue = self._worker, self._queue
+        self._worker = None
+        self._queue = None
+
+        # 処理中のバッチはワーカーのキャンセル時に失敗させる
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+        # キューに残っているリクエストを失敗させる
+        if queue is not None:
+            while not queue.empty():
+                _fail_pending([queue.get_nowait()])
+
+    async def _run(self, queue: asyncio.Queue[_Pending]) -> None:
+        """キューからリクエストを取り出してバッチ単位で処理し続けます"""
+        loop = asyncio.get_running_loop()
+        batch: list[_Pending] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+
+                # 時間窓の間に届いたリクエストを最大件数まで集める
+                deadline = loop.time() + self._window_seconds
+                while len(batch) < self._max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                queries = [query for query, _ in batch]
+                try:
+                    answers = await run_in_threadpool(
+                        self._get_rag_service().generate_answers_batch, queries
+                    )
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), answer in zip(batch, answers):
+                    # 待機中にキャンセルされたリクエストには結果を設定しない
+                    if not future.done():
+                        future.set_result(answer)
+        except asyncio.CancelledError:
+            # 停止時に集めていた、または処理中だったバッチを失敗させる
+            _fail_pending(batch)
+            raise
+
+def _fail_pending(batch: list[_Pending]) -> None:
+    """回答待ちのリクエストをシャットダウンのエラーで失敗させます"""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(RuntimeError("Chat batcher has been shut down"))
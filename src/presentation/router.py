@@ -1,80 +1,387 @@
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status, Header, UploadFile, File
-from pydantic import BaseModel
+import codecs
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from itertools import repeat
+from typing import Annotated, Any, Callable, cast
+from fastapi import APIRouter, HTTPException, Query, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from typing import Optional
-import PyPDF2
-import io
 
-from domain.models import UserQuery, DocumentInput
-from domain.interfaces import IRagService, IDocumentService
-from domain.user_models import UserLoginRequest, UserRegisterRequest
-from infrastructure.auth_service import AuthService
-from infrastructure.auth_middleware import get_current_user
+from src.domain.models import UserQuery, DocumentInput, DocumentInfo
+from src.domain.interfaces import IRagService, IDocumentService
+from src.domain.user_models import UserLoginRequest, UserRegisterRequest
+from src.infrastructure.auth_service import AuthService
+from src.infrastructure.upload_limit_middleware import upload_too_large_detail
+from src.presentation.chat_batcher import ChatBatcher
+import config
+
+logger = logging.getLogger(__name__)
+
+# /chat/batch で一度に受け付ける質問の最大件数
+MAX_CHAT_BATCH_SIZE = 100
+
+# /documents/batch で一度に受け付けるドキュメントの最大件数
+MAX_DOCUMENT_BATCH_SIZE = 100
+
+# ドキュメント一覧で返すコンテンツの抜粋の文字数
+LIST_SNIPPET_LENGTH = 200
+
+# アップロードファイルを読み込む際のチャンクサイズ
+_READ_CHUNK_SIZE = 64 * 1024
+
+# アップロードサイズ超過時のエラーメッセージ（ミドルウェアと共通）
+_UPLOAD_TOO_LARGE_DETAIL = upload_too_large_detail(config.MAX_UPLOAD_BYTES)
+
+# このページ数以上のPDFはプロセスプールで並列にテキスト抽出する
+PDF_PARALLEL_MIN_PAGES = 20
+
+# PDFのテキスト抽出に使うワーカープロセス数の上限
+PDF_POOL_MAX_WORKERS = 8
+
+# PDFのテキスト抽出用プロセスプール（アプリのlifespanで作成・破棄し、リクエスト間で共有）
+_PDF_WORKERS = min(os.process_cpu_count() or 1, PDF_POOL_MAX_WORKERS)
+_PDF_POOL: ProcessPoolExecutor | None = None
+
+# ドキュメント詳細キャッシュの有効期限（秒）と最大件数
+DOC_CACHE_TTL_SECONDS = 60.0
+DOC_CACHE_SIZE = 1024
+
+# ドキュメントID -> (キャッシュした時刻, ドキュメント詳細) のLRUキャッシュ
+_DOC_CACHE: OrderedDict[str, tuple[float, DocumentInfo]] = OrderedDict()
+
+
+# Request/Response モデル
+class ChatRequest(BaseModel):
+    question: str
+
+
+class ChatResponse(BaseModel):
+    answer: str
+
+
+class DocumentUploadRequest(BaseModel):
+    content: str
+    metadata: dict[str, Any] | None = None
+
+
+class DocumentUploadResponse(BaseModel):
+    success: bool
+    message: str
+    documents_count: int | None = None
+
+
+class ClearDocumentsResponse(BaseModel):
+    success: bool
+    message: str
+
+
+class DocumentInfoResponse(BaseModel):
+    id: str
+    content: str
+    metadata: dict[str, Any] | None = None
+    created_at: str | None = None
+
+
+class DocumentListItemResponse(BaseModel):
+    id: str
+    content: str
+    metadata: dict[str, Any] | None = None
+    created_at: str | None = None
+
+
+class DocumentListResponseData(BaseModel):
+    success: bool
+    message: str
+    documents: list[DocumentListItemResponse]
+    total_count: int
+
+
+class AuthResponse(BaseModel):
+    success: bool
+    message: str
+    access_token: Optional[str] = None
+    user_id: Optional[str] = None
+    username: Optional[str] = None
+
+
+# リクエストボディのJSONをPydanticのRustコアで直接モデルに変換するアダプター
+_DOCUMENT_UPLOAD_ADAPTER = TypeAdapter(DocumentUploadRequest)
+
+# 件数の上限はリスト要素の検証中に確認し、上限を超えた時点で打ち切る
+_CHAT_BATCH_ADAPTER = TypeAdapter(
+    Annotated[list[ChatRequest], Field(max_length=MAX_CHAT_BATCH_SIZE)]
+)
+_DOCUMENT_BATCH_UPLOAD_ADAPTER = TypeAdapter(
+    Annotated[
+        list[DocumentUploadRequest],
+        Field(min_length=1, max_length=MAX_DOCUMENT_BATCH_SIZE),
+    ]
+)
+
+
+def _is_json_content_type(content_type: str | None) -> bool:
+    """Content-TypeがJSON（application/json または application/*+json）か判定します"""
+    if not content_type:
+        # FastAPIと同様、Content-Typeがない場合はJSONとして扱う
+        return True
+    media_type = content_type.partition(";")[0].strip().lower()
+    maintype, _, subtype = media_type.partition("/")
+    return maintype == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
+async def _validate_body(request: Request, adapter: TypeAdapter[Any]) -> Any:
+    """
+    リクエストボディをバイト列から直接検証します
+
+    FastAPIのボディ解析と同じく、JSON以外のContent-Typeのボディは
+    JSONとして解釈せず、エラーの位置には "body" を付与します。
+
+    Args:
+        request: リクエスト
+        adapter: 検証に使用するTypeAdapter
+
+    Returns:
+        検証済みのボディ
+
+    Raises:
+        RequestValidationError: ボディが不正な場合（422）
+    """
+    body = await request.body()
+    try:
+        if _is_json_content_type(request.headers.get("content-type")):
+            return adapter.validate_json(body)
+        return adapter.validate_python(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**err, "loc": ("body", *err["loc"])}
+                for err in e.errors(include_url=False)
+            ]
+        )
+
+
+def _snippet(content: str) -> str:
+    """ドキュメント一覧用にコンテンツの先頭部分を切り出します"""
+    if len(content) > LIST_SNIPPET_LENGTH:
+        return content[:LIST_SNIPPET_LENGTH] + "..."
+    return content
+
+
+def _get_cached_document(document_id: str) -> DocumentInfo | None:
+    """有効期限内のキャッシュ済みドキュメント詳細を取得します"""
+    entry = _DOC_CACHE.get(document_id)
+    if entry is None:
+        return None
+    cached_at, doc = entry
+    if time.monotonic() - cached_at > DOC_CACHE_TTL_SECONDS:
+        del _DOC_CACHE[document_id]
+        return None
+    _DOC_CACHE.move_to_end(document_id)
+    return doc
+
+
+def _store_document(doc: DocumentInfo) -> None:
+    """ドキュメント詳細をキャッシュに保存します（上限を超えた場合は最も古いものを破棄）"""
+    _DOC_CACHE[doc.id] = (time.monotonic(), doc)
+    _DOC_CACHE.move_to_end(doc.id)
+    if len(_DOC_CACHE) > DOC_CACHE_SIZE:
+        _DOC_CACHE.popitem(last=False)
+
+
+def _spooled_file_path(file: UploadFile) -> Optional[str]:
+    """
+    ディスクへ書き出し済みのアップロードファイルを開くためのパスを返します
+
+    Starlette は一定サイズを超えたアップロードを名前のない一時ファイルへ
+    書き出すため、/proc 経由のファイルディスクリプタのパスを使います。
+    プロセスプールのワーカーからも開けるよう、自プロセスのPIDを含めます。
+
+    Args:
+        file: アップロードファイル
+
+    Returns:
+        ファイルのパス（メモリ上にある場合や /proc がない環境ではNone）
+    """
+    if not getattr(file.file, "_rolled", False):
+        return None
+    path = f"/proc/{os.getpid()}/fd/{file.file.fileno()}"
+    if not os.path.exists(path):
+        return None
+    # バッファに残っている内容をディスクへ書き出しておく
+    file.file.flush()
+    return path
+
+
+def _parse_md(path: str) -> str:
+    """Markdownファイルの内容をチャンクごとにデコードしてテキストに変換します"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts: list[str] = []
+    with open(path, "rb") as fp:
+        while chunk := fp.read(_READ_CHUNK_SIZE):
+            parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _extract_pages(path: str, start: int, stop: int) -> str:
+    """
+    PDFの指定範囲のページからテキストを抽出します
+
+    プロセスプールのワーカーから呼び出されるため、モジュールのトップレベルに定義します。
+
+    Args:
+        path: PDFファイルのパス
+        start: 抽出を開始するページ番号
+        stop: 抽出を終了するページ番号（このページは含まない）
+
+    Returns:
+        抽出したテキスト
+    """
+    # PyMuPDFは最初のPDF処理時にのみ読み込む（起動時間短縮のため）
+    import pymupdf
+
+    with pymupdf.open(path, filetype="pdf") as doc:
+        return "\n".join(
+            cast(str, doc[i].get_text("text")) for i in range(start, stop)
+        )
+
+
+def _parse_pdf(path: str) -> str:
+    """PDFファイルからテキストを抽出します（ページ数が多い場合は並列に処理）"""
+    import pymupdf
+
+    pool = _PDF_POOL
+    with pymupdf.open(path, filetype="pdf") as doc:
+        page_count = doc.page_count
+        # ページ数が少ない場合はプロセス間通信のコストの方が大きいため直接抽出
+        if page_count < PDF_PARALLEL_MIN_PAGES or pool is None:
+            return "\n".join(cast(str, page.get_text("text")) for page in doc)
+
+    # ワーカー数に合わせてページ範囲を分割し、範囲ごとに並列で抽出
+    step = -(-page_count // _PDF_WORKERS)
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+    return "\n".join(pool.map(_extract_pages, repeat(path), starts, stops))
+
+
+def start_pdf_pool() -> None:
+    """
+    PDFのテキスト抽出用プロセスプールを作成します
+
+    マルチスレッドのサーバープロセスからforkするとデッドロックの恐れがあり、
+    アプリ全体のメモリも引き継いでしまうため、forkserverでワーカーを起動します。
+    """
+    global _PDF_POOL
+    if _PDF_POOL is None and _PDF_WORKERS > 1:
+        _PDF_POOL = ProcessPoolExecutor(
+            max_workers=_PDF_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+
+
+def shutdown_pdf_pool() -> None:
+    """PDFのテキスト抽出用プロセスプールを終了します"""
+    global _PDF_POOL
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=True, cancel_futures=True)
+        _PDF_POOL = None
+
+
+# 拡張子（小文字）-> ファイルパスを受け取りテキストを返すパーサー
+_PARSERS: dict[str, Callable[[str], str]] = {
+    ".md": _parse_md,
+    ".pdf": _parse_pdf,
+}
 
 
 def get_router(
-    rag_service: IRagService, document_service: IDocumentService, auth_service: AuthService
+    get_rag_service: Callable[[], IRagService],
+    get_document_service: Callable[[], IDocumentService],
+    auth_service: AuthService,
 ) -> APIRouter:
     """
     DIコンテナからサービスを受け取り、ルーターを作成します
 
+    RAGサービス・ドキュメントサービスはlangchain_openai・langchain_chromaを
+    読み込むため、インスタンスではなく取得関数を受け取り、起動時（lifespan）
+    またはlifespanが実行されない場合は初回利用時に解決します。
+
     Args:
-        rag_service: 依存性注入されたRAGサービス
-        document_service: 依存性注入されたドキュメントサービス
+        get_rag_service: 依存性注入されたRAGサービスを返す関数
+        get_document_service: 依存性注入されたドキュメントサービスを返す関数
+        auth_service: 依存性注入された認証サービス
 
     Returns:
         ルーター
     """
-    router = APIRouter()
-
-    # Request/Response モデル
-    class ChatRequest(BaseModel):
-        question: str
-
-    class ChatResponse(BaseModel):
-        answer: str
-
-    class DocumentUploadRequest(BaseModel):
-        content: str
-        metadata: dict[str, Any] | None = None
-
-    class DocumentUploadResponse(BaseModel):
-        success: bool
-        message: str
-        documents_count: int | None = None
-
-    class ClearDocumentsResponse(BaseModel):
-        success: bool
-        message: str
-
-    class DocumentInfoResponse(BaseModel):
-        id: str
-        content: str
-        metadata: dict[str, Any] | None = None
-        created_at: str | None = None
-
-    class DocumentListItemResponse(BaseModel):
-        id: str
-        content: str
-        metadata: dict[str, Any] | None = None
-        created_at: str | None = None
-
-    class DocumentListResponseData(BaseModel):
-        success: bool
-        message: str
-        documents: list[DocumentListItemResponse]
-        total_count: int
-
-    class AuthResponse(BaseModel):
-        success: bool
-        message: str
-        access_token: Optional[str] = None
-        user_id: Optional[str] = None
-        username: Optional[str] = None
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[None]:
+        """
+        ルーターが使用するリソースを起動・終了します
+
+        Args:
+            app: ルーターを登録したアプリケーション
+        """
+        # 最初のリクエストで初期化の待ち時間が発生しないよう起動時に解決しておく
+        get_rag_service()
+        get_document_service()
+
+        # PDFのテキスト抽出用プロセスプールはサーバーの起動後に作成する
+        start_pdf_pool()
+        try:
+            yield
+        finally:
+            # 回答待ちのチャットリクエストを失敗させてからワーカーを止める
+            await chat_batcher.aclose()
+            shutdown_pdf_pool()
+
+    router = APIRouter(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+    # 同時に届いたチャットリクエストをまとめてRAGサービスに渡す
+    chat_batcher = ChatBatcher(get_rag_service)
+
+    async def add_documents(doc_inputs: list[DocumentInput]) -> ORJSONResponse:
+        """
+        ドキュメントをまとめてベクトルストアに投入し、レスポンスを作成します
+
+        各投入エンドポイントはこの関数を経由し、埋め込みを1回の呼び出しで行います。
+
+        Args:
+            doc_inputs: 投入するドキュメントのリスト
+
+        Returns:
+            投入結果
+        """
+        # 分割・埋め込みはブロッキング処理のためスレッドプールで実行
+        result = await run_in_threadpool(get_document_service().add_documents, doc_inputs)
+        if result.success:
+            # ドキュメントが追加されたためキャッシュ済みの回答を破棄
+            get_rag_service().clear_cache()
+
+        return ORJSONResponse(
+            {
+                "success": result.success,
+                "message": result.message,
+                "documents_count": result.documents_count,
+            }
+        )
 
     # 認証エンドポイント
-    @router.post("/auth/register", response_model=AuthResponse, tags=["Auth"])
-    async def register(request: UserRegisterRequest) -> AuthResponse:
+    @router.post(
+        "/auth/register", responses={200: {"model": AuthResponse}}, tags=["Auth"]
+    )
+    async def register(request: UserRegisterRequest) -> ORJSONResponse:
         """
         新規ユーザーを登録します
 
@@ -85,14 +392,20 @@ def get_router(
             登録結果
         """
         result = auth_service.register(request)
-        return AuthResponse(
-            success=result.success,
-            message=result.message,
-            user_id=result.user_id,
+        return ORJSONResponse(
+            {
+                "success": result.success,
+                "message": result.message,
+                "access_token": None,
+                "user_id": result.user_id,
+                "username": None,
+            }
         )
 
-    @router.post("/auth/login", response_model=AuthResponse, tags=["Auth"])
-    async def login(request: UserLoginRequest) -> AuthResponse:
+    @router.post(
+        "/auth/login", responses={200: {"model": AuthResponse}}, tags=["Auth"]
+    )
+    async def login(request: UserLoginRequest) -> ORJSONResponse:
         """
         ユーザーをログインさせます
 
@@ -103,32 +416,29 @@ def get_router(
             ログイン結果（成功時はアクセストークンを含む）
         """
         result = auth_service.login(request)
-        return AuthResponse(
-            success=result.success,
-            message=result.message,
-            access_token=result.access_token,
-            user_id=result.user_id,
-            username=result.username,
+        return ORJSONResponse(
+            {
+                "success": result.success,
+                "message": result.message,
+                "access_token": result.access_token,
+                "user_id": result.user_id,
+                "username": result.username,
+            }
         )
 
     @router.post("/auth/logout", tags=["Auth"])
-    async def logout(
-        current_user: dict = Depends(get_current_user),
-    ) -> dict[str, str]:
+    async def logout() -> ORJSONResponse:
         """
         ユーザーをログアウトさせます
 
-        Args:
-            current_user: 認証されたユーザー情報
-
         Returns:
             ログアウト完了メッセージ
         """
-        return {"message": "ログアウトしました"}
+        return ORJSONResponse({"message": "ログアウトしました"})
 
     # Chat エンドポイント
-    @router.post("/chat", response_model=ChatResponse, tags=["Chat"])
-    async def chat(request: ChatRequest) -> ChatResponse:
+    @router.post("/chat", responses={200: {"model": ChatResponse}}, tags=["Chat"])
+    async def chat(request: ChatRequest) -> ORJSONResponse:
         """
         ユーザーの質問に対してRAGを使用して回答を生成します
 
@@ -141,53 +451,142 @@ def get_router(
         # ドメインモデルに変換
         query = UserQuery(content=request.question)
 
-        # RAGサービスで回答を生成
-        answer = rag_service.generate_answer(query)
+        # 同時に届いた他のリクエストとまとめてRAGサービスで回答を生成
+        answer = await chat_batcher.submit(query)
+
+        return ORJSONResponse({"answer": answer.content})
+
+    @router.post(
+        "/chat/batch",
+        responses={200: {"model": list[ChatResponse]}},
+        tags=["Chat"],
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "array",
+                            "items": ChatRequest.model_json_schema(),
+                            "maxItems": MAX_CHAT_BATCH_SIZE,
+                        }
+                    }
+                },
+            }
+        },
+    )
+    async def chat_batch(request: Request) -> ORJSONResponse:
+        """
+        複数の質問に対してまとめてRAGを使用して回答を生成します
+
+        Args:
+            request: ユーザーの質問のリスト（最大100件）をボディに含むリクエスト
+
+        Returns:
+            各質問に対応するAI生成の回答を含むレスポンスのリスト
+        """
+        body = await _validate_body(request, _CHAT_BATCH_ADAPTER)
+
+        # ドメインモデルに変換
+        queries = [UserQuery(content=item.question) for item in body]
+
+        # RAGサービスで回答をまとめて生成
+        answers = await run_in_threadpool(get_rag_service().generate_answers_batch, queries)
 
-        return ChatResponse(answer=answer.content)
+        return ORJSONResponse([{"answer": answer.content} for answer in answers])
 
     # ドキュメント投入エンドポイント（テキスト）
-    @router.post("/documents", response_model=DocumentUploadResponse, tags=["Documents"])
-    async def upload_documents(
-        request: DocumentUploadRequest,
-        current_user: dict = Depends(get_current_user),
-    ) -> DocumentUploadResponse:
+    @router.post(
+        "/documents",
+        responses={200: {"model": DocumentUploadResponse}},
+        tags=["Documents"],
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": DocumentUploadRequest.model_json_schema()
+                    }
+                },
+            }
+        },
+    )
+    async def upload_documents(request: Request) -> ORJSONResponse:
         """
         ドキュメントをベクトルストアに投入します
 
+        リクエストボディは中間の辞書を経由せず、バイト列から直接検証します。
+
         Args:
-            request: 投入するドキュメント
+            request: 投入するドキュメントをボディに含むリクエスト
 
         Returns:
             投入結果
         """
+        body = await _validate_body(request, _DOCUMENT_UPLOAD_ADAPTER)
+
         # ドメインモデルに変換
         doc_input = DocumentInput(
-            content=request.content,
-            metadata=request.metadata,
+            content=body.content,
+            metadata=body.metadata,
         )
 
-        # ドキュメントサービスで投入
-        result = document_service.add_documents([doc_input])
+        return await add_documents([doc_input])
+
+    # ドキュメント一括投入エンドポイント（テキスト）
+    @router.post(
+        "/documents/batch",
+        responses={200: {"model": DocumentUploadResponse}},
+        tags=["Documents"],
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "array",
+                            "items": DocumentUploadRequest.model_json_schema(),
+                            "minItems": 1,
+                            "maxItems": MAX_DOCUMENT_BATCH_SIZE,
+                        }
+                    }
+                },
+            }
+        },
+    )
+    async def upload_documents_batch(request: Request) -> ORJSONResponse:
+        """
+        複数のドキュメントをまとめてベクトルストアに投入します
 
-        return DocumentUploadResponse(
-            success=result.success,
-            message=result.message,
-            documents_count=result.documents_count,
-        )
+        Args:
+            request: 投入するドキュメントのリスト（最大100件）をボディに含むリクエスト
+
+        Returns:
+            投入結果
+        """
+        body = await _validate_body(request, _DOCUMENT_BATCH_UPLOAD_ADAPTER)
+
+        # ドメインモデルに変換
+        doc_inputs = [
+            DocumentInput(content=item.content, metadata=item.metadata) for item in body
+        ]
+
+        return await add_documents(doc_inputs)
 
     # ファイルアップロードエンドポイント（Markdown/PDF）
-    @router.post("/documents/upload-file", response_model=DocumentUploadResponse, tags=["Documents"])
+    @router.post(
+        "/documents/upload-file",
+        responses={200: {"model": DocumentUploadResponse}},
+        tags=["Documents"],
+    )
     async def upload_file(
         file: UploadFile = File(...),
-        current_user: dict = Depends(get_current_user),
-    ) -> DocumentUploadResponse:
+    ) -> ORJSONResponse:
         """
         MarkdownまたはPDFファイルをアップロードして投入します
 
         Args:
             file: アップロードするファイル（.md, .pdf）
-            current_user: 認証されたユーザー情報
 
         Returns:
             投入結果
@@ -195,25 +594,40 @@ def get_router(
         if not file.filename:
             raise HTTPException(status_code=400, detail="ファイル名が必要です")
 
-        # ファイルタイプの判定
-        if file.filename.endswith(".md"):
-            # Markdownファイルの処理
-            content = await file.read()
-            text_content = content.decode("utf-8")
-        elif file.filename.endswith(".pdf"):
-            # PDFファイルの処理
-            content = await file.read()
-            try:
-                pdf_file = io.BytesIO(content)
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                text_content = ""
-                for page in pdf_reader.pages:
-                    text_content += page.extract_text() + "\n"
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"PDFの読み込みエラー: {str(e)}")
-        else:
+        # サイズ上限を超えるファイルは読み込む前に拒否する
+        if file.size is not None and file.size > config.MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail=_UPLOAD_TOO_LARGE_DETAIL)
+
+        # 拡張子からパーサーを選択（対応していないファイルは読み込む前に拒否する）
+        parser = _PARSERS.get(os.path.splitext(file.filename)[1].lower())
+        if parser is None:
             raise HTTPException(status_code=400, detail="Markdown (.md) またはPDF (.pdf) ファイルをアップロードしてください")
 
+        async def parse() -> str:
+            # ディスクへ書き出し済みのファイルはそのまま解析する
+            path = _spooled_file_path(file)
+            if path is not None:
+                return await run_in_threadpool(parser, path)
+
+            # メモリ上にある場合のみ、チャンクごとに一時ファイルへコピーする
+            # （受信中のサイズ上限はUploadSizeLimitASGIMiddlewareで確認済み）
+            with tempfile.NamedTemporaryFile() as tmp:
+                while chunk := await file.read(_READ_CHUNK_SIZE):
+                    tmp.write(chunk)
+                tmp.flush()
+                return await run_in_threadpool(parser, tmp.name)
+
+        # ファイルの解析（CPU負荷が高いためスレッドプールで実行）
+        try:
+            text_content = await parse()
+        except BrokenExecutor:
+            # プロセスプールの障害はファイルの問題ではないためサーバーエラーとして扱う
+            raise
+        except Exception:
+            # 例外にはサーバー上のパスが含まれるため、詳細はログにのみ出力する
+            logger.exception("Failed to parse uploaded file: %s", file.filename)
+            raise HTTPException(status_code=400, detail="ファイルの読み込みに失敗しました")
+
         if not text_content.strip():
             raise HTTPException(status_code=400, detail="ファイルが空です")
 
@@ -222,48 +636,61 @@ def get_router(
             content=text_content,
             metadata={"filename": file.filename, "file_type": file.content_type},
         )
-        result = document_service.add_documents([doc_input])
-
-        return DocumentUploadResponse(
-            success=result.success,
-            message=result.message,
-            documents_count=result.documents_count,
-        )
+        return await add_documents([doc_input])
 
     # ドキュメント一覧エンドポイント
-    @router.get("/documents", response_model=DocumentListResponseData, tags=["Documents"])
+    @router.get(
+        "/documents",
+        responses={200: {"model": DocumentListResponseData}},
+        tags=["Documents"],
+    )
     async def list_documents(
-        current_user: dict = Depends(get_current_user),
-    ) -> DocumentListResponseData:
+        limit: int = Query(50, ge=1, le=1000),
+        offset: int = Query(0, ge=0),
+        include_content: bool = False,
+    ) -> ORJSONResponse:
         """
-        ベクトルストア内の全ドキュメント一覧を取得します
+        ベクトルストア内のドキュメント一覧を取得します
+
+        件数が多くなるため、Pydanticモデルを経由せずに
+        辞書をそのままorjsonでシリアライズします。
+
+        Args:
+            limit: 取得する最大件数
+            offset: 取得を開始する位置
+            include_content: Trueの場合は抜粋ではなく完全なコンテンツを返す
 
         Returns:
             ドキュメント一覧
         """
-        result = document_service.list_documents()
-
-        return DocumentListResponseData(
-            success=result.success,
-            message=result.message,
-            documents=[
-                DocumentListItemResponse(
-                    id=doc.id,
-                    content=doc.content,
-                    metadata=doc.metadata,
-                    created_at=doc.created_at,
-                )
-                for doc in result.documents
-            ],
-            total_count=result.total_count,
+        result = get_document_service().list_documents(limit=limit, offset=offset)
+
+        return ORJSONResponse(
+            {
+                "success": result.success,
+                "message": result.message,
+                "documents": [
+                    {
+                        "id": doc.id,
+                        "content": doc.content if include_content else _snippet(doc.content),
+                        "metadata": doc.metadata,
+                        "created_at": doc.created_at,
+                    }
+                    for doc in result.documents
+                ],
+                "total_count": result.total_count,
+            }
         )
 
     # ドキュメント詳細エンドポイント
-    @router.get("/documents/{document_id}", response_model=DocumentInfoResponse, tags=["Documents"])
+    @router.get(
+        "/documents/{document_id}",
+        responses={200: {"model": DocumentInfoResponse}},
+        tags=["Documents"],
+    )
     async def get_document(
         document_id: str,
-        current_user: dict = Depends(get_current_user),
-    ) -> DocumentInfoResponse:
+    ) -> ORJSONResponse:
         """
         指定されたIDのドキュメント詳細を取得します
 
@@ -273,35 +700,42 @@ def get_router(
         Returns:
             ドキュメント詳細情報
         """
-        doc = document_service.get_document(document_id)
-
+        doc = _get_cached_document(document_id)
         if doc is None:
-            from fastapi import HTTPException
-            raise HTTPException(status_code=404, detail="Document not found")
-
-        return DocumentInfoResponse(
-            id=doc.id,
-            content=doc.content,
-            metadata=doc.metadata,
-            created_at=doc.created_at,
+            doc = get_document_service().get_document(document_id)
+
+            if doc is None:
+                raise HTTPException(status_code=404, detail="Document not found")
+
+            _store_document(doc)
+
+        return ORJSONResponse(
+            {
+                "id": doc.id,
+                "content": doc.content,
+                "metadata": doc.metadata,
+                "created_at": doc.created_at,
+            }
         )
 
     # ドキュメントクリアエンドポイント
-    @router.delete("/documents", response_model=ClearDocumentsResponse, tags=["Documents"])
-    async def clear_documents(
-        current_user: dict = Depends(get_current_user),
-    ) -> ClearDocumentsResponse:
+    @router.delete(
+        "/documents",
+        responses={200: {"model": ClearDocumentsResponse}},
+        tags=["Documents"],
+    )
+    async def clear_documents() -> ORJSONResponse:
         """
         ベクトルストア内の全ドキュメントをクリアします
 
         Returns:
             クリア結果
         """
-        result = document_service.clear_documents()
+        result = get_document_service().clear_documents()
+        if result.success:
+            get_rag_service().clear_cache()
+            _DOC_CACHE.clear()
 
-        return ClearDocumentsResponse(
-            success=result.success,
-            message=result.message,
-        )
+        return ORJSONResponse({"success": result.success, "message": result.message})
 
     return router